@@ -1,25 +1,248 @@
 # backend/resume_improv_lib/generator.py
 
-from typing import Dict, List, Any
+import asyncio
+import re
+import sys
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, zip_longest
+from types import MappingProxyType
+from typing import Callable, Dict, List, Any, Mapping, NamedTuple, Optional, Tuple
+from google.api_core import exceptions as gexc
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 from backend.resume_improv_lib.schemas import ResumeSuggestion
 from backend.resume_improv_lib.llm_handler import llm_call
 
 
+# -------------------- LLM fan-out --------------------
+
+# Gemini quota is 500 QPM at a typical ~4 s per call; by Little's law that allows
+# QPM * latency / 60 calls in flight.
+_GEMINI_QPM = 500
+_GEMINI_AVG_LATENCY_S = 4
+_LLM_CONCURRENCY = _GEMINI_QPM * _GEMINI_AVG_LATENCY_S // 60
+
+# One semaphore per event loop: asyncio primitives bind to the loop that first waits on
+# them, so a single module-level semaphore breaks the next `asyncio.run(...)`.
+_LLM_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _llm_semaphore() -> asyncio.Semaphore:
+    """The rate-limit semaphore of the running loop, shared by every LLM call on it."""
+    loop = asyncio.get_running_loop()
+    semaphore = _LLM_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = _LLM_SEMAPHORES[loop] = asyncio.Semaphore(_LLM_CONCURRENCY)
+    return semaphore
+
+
+# Dedicated workers for the blocking `llm_call`, sized to the semaphore so the semaphore is
+# the real limit (the loop's default executor has only min(32, cpus + 4) threads and is
+# shared with everything else).
+_LLM_EXECUTOR = ThreadPoolExecutor(max_workers=_LLM_CONCURRENCY, thread_name_prefix="llm_call")
+
+
+# Rate-limit / overload errors are retried with jittered backoff; anything else fails fast.
+_TRANSIENT_LLM_ERRORS = (gexc.ResourceExhausted, gexc.ServiceUnavailable)
+_retry_transient = retry(
+    stop=stop_after_attempt(4),
+    wait=wait_random_exponential(multiplier=0.5, max=8),
+    retry=retry_if_exception_type(_TRANSIENT_LLM_ERRORS),
+    reraise=True,
+)
+
+
+@_retry_transient
+async def _allm_call_once(llm_client, text: str, instr: str) -> str:
+    # the semaphore is taken per attempt, so backoff sleeps don't hold a slot
+    async with _llm_semaphore():
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_LLM_EXECUTOR, llm_call, llm_client, text, instr)
+
+
+async def _allm_call(llm_client, text: str, instr: str) -> str:
+    """
+    Run the blocking `llm_call` on `_LLM_EXECUTOR`, bounded by the rate-limit semaphore.
+    Returns "" if transient errors persist, so that one suggestion is skipped instead of the whole resume.
+    """
+    try:
+        return await _allm_call_once(llm_client, text, instr)
+    except _TRANSIENT_LLM_ERRORS:
+        return ""
+
+
+@_retry_transient
+async def _agenerate_once(llm_client, prompt: str) -> str:
+    async with _llm_semaphore():
+        response = await llm_client.generate_content_async(prompt)
+    return response.text or ""
+
+
+# Bullets sharing an instruction are rewritten together; keep each prompt small.
+_BATCH_SIZE = 16
+_BATCH_MARKER_RE = re.compile(r"^\[(\d+)\]\s*", re.MULTILINE)
+# an item also ends at a blank line or a code-fence line (closing remarks, ``` wrappers)
+_BATCH_ITEM_END_RE = re.compile(r"\n\s*\n|^\s*```", re.MULTILINE)
+
+
+def _parse_batch_reply(text: str, n: int) -> List[str]:
+    """
+    Split a `[i]`-numbered reply into n items. Each item runs up to the next marker,
+    a blank line or a code fence, so rewrites spanning several lines are kept whole but
+    trailing chatter is dropped; missing items come back as "".
+    """
+    improved = [""] * n
+    markers = list(_BATCH_MARKER_RE.finditer(text))
+    for match, following in zip(markers, markers[1:] + [None]):
+        i = int(match.group(1)) - 1
+        if 0 <= i < n and not improved[i]:
+            end = following.start() if following else len(text)
+            item = text[match.end():end]
+            if (stop := _BATCH_ITEM_END_RE.search(item)) is not None:
+                item = item[:stop.start()]
+            improved[i] = item.strip()
+    return improved
+
+
+async def _batch_llm_call(llm_client, originals: List[str], instruction: str) -> List[str]:
+    """
+    Rewrite several bullets with the same instruction in one Gemini call.
+    Returns one result per input, in order. Items the batched reply does not cover
+    (blocked / empty response, or an item left out) are retried one by one through
+    `llm_call`, so they still get `llm_handler`'s prompt and response handling.
+    The whole batch comes back as "" if transient errors persist.
+    """
+    if len(originals) == 1:
+        return [await _allm_call(llm_client, originals[0], instruction)]
+
+    n = len(originals)
+    numbered = "\n".join(f"[{i}] {' '.join(text.split())}" for i, text in enumerate(originals, 1))
+    prompt = (f"Rewrite each of the following {n} resume bullets per instruction `{instruction}`. "
+              f"Return exactly {n} items, each starting on a new line with its `[i]` prefix:\n{numbered}")
+    try:
+        text = await _agenerate_once(llm_client, prompt)
+    except _TRANSIENT_LLM_ERRORS:
+        return [""] * n
+    except ValueError:
+        # `response.text` raises when the reply was blocked or has no parts
+        text = ""
+
+    improved = _parse_batch_reply(text, n)
+    missing = [i for i, t in enumerate(improved) if not t]
+    if missing:
+        retried = await asyncio.gather(*(_allm_call(llm_client, originals[i], instruction) for i in missing))
+        for i, t in zip(missing, retried):
+            improved[i] = t
+    return improved
+
+
+class _LLMWorkQueue:
+    """
+    Per-call state for `generate_resume_improvements`: the LLM rewrites requested so far
+    and the combined text of each section entry.
+    Identical (original, instruction) pairs share a single future, so overlapping flags
+    never pay for the same call twice. `flush()` dispatches the unique pairs; per-item
+    bullets queued with `batch=True` are batched by (section, instruction), everything
+    else goes through `llm_call` one at a time.
+    """
+
+    def __init__(self, llm_client) -> None:
+        self.llm_client = llm_client
+        self.futures: Dict[Tuple[str, str], "asyncio.Future[str]"] = {}
+        # (original, instruction) -> section to batch it with, or None to send it alone
+        self.batch_sections: Dict[Tuple[str, str], Optional[str]] = {}
+        # (section, issue, original, orig_hash, future) in the order suggestions were requested
+        self.entries: List[Tuple[str, str, str, int, "asyncio.Future[str]"]] = []
+        # original -> _norm_hash(original), shared by every flag raised on the same text
+        self.orig_hashes: Dict[str, int] = {}
+        # id(entry) -> combined text; the resume keeps every entry alive for the whole call
+        self.entry_texts: Dict[int, str] = {}
+
+    def entry_text(self, entry: Any) -> str:
+        """`_combine_entry_text`, computed once per entry for the duration of the call."""
+        key = id(entry)
+        text = self.entry_texts.get(key)
+        if text is None:
+            text = self.entry_texts[key] = _combine_entry_text(entry)
+        return text
+
+    def submit(self, original: str, instr: str, batch_section: Optional[str] = None) -> "asyncio.Future[str]":
+        """
+        Return the future for rewriting `original` with `instr`, creating it on first use.
+        `batch_section` is only honoured by the first submission of a pair.
+        """
+        key = (original, instr)
+        future = self.futures.get(key)
+        if future is None:
+            future = self.futures[key] = asyncio.get_running_loop().create_future()
+            self.batch_sections[key] = batch_section
+        return future
+
+    def suggest(self, section: str, issue: str, original: str, instr: str, batch: bool = False) -> None:
+        """
+        Queue a rewrite of `original` to be reported as a suggestion for `section`.
+        Pass `batch=True` for per-item entries of experience-like and list sections; they may
+        share a numbered prompt with other entries of the same section and instruction.
+        A role entry can be several bullets joined with " • "; it is sent flattened to one line.
+        """
+        orig_hash = self.orig_hashes.get(original)
+        if orig_hash is None:
+            orig_hash = self.orig_hashes[original] = _norm_hash(original)
+        future = self.submit(original, instr, section if batch else None)
+        self.entries.append((section, issue, original, orig_hash, future))
+
+    async def flush(self) -> None:
+        """Run every unique queued call and resolve its future."""
+        singles: List[Tuple[str, str]] = []
+        batches: Dict[Tuple[str, str], List[str]] = {}
+        for (original, instr), section in self.batch_sections.items():
+            if section is None:
+                singles.append((original, instr))
+            else:
+                batches.setdefault((section, instr), []).append(original)
+
+        await asyncio.gather(
+            *(self._dispatch_one(original, instr) for original, instr in singles),
+            *(
+                self._dispatch(originals[start:start + _BATCH_SIZE], instr)
+                for (_, instr), originals in batches.items()
+                for start in range(0, len(originals), _BATCH_SIZE)
+            ),
+        )
+
+    async def _dispatch_one(self, original: str, instr: str) -> None:
+        self.futures[(original, instr)].set_result(await _allm_call(self.llm_client, original, instr))
+
+    async def _dispatch(self, originals: List[str], instr: str) -> None:
+        results = await _batch_llm_call(self.llm_client, originals, instr)
+        for original, improved in zip(originals, results):
+            self.futures[(original, instr)].set_result(improved)
+
+
 # -------------------- small utilities --------------------
 
+def _norm_hash(text: str) -> int:
+    """Hash of the case- and whitespace-insensitive form used to detect unchanged rewrites."""
+    return hash((text or "").strip().casefold())
+
+
 def _append_if_changed(
     out: List[ResumeSuggestion],
     section: str,
     issue: str,
     original: str,
+    orig_hash: int,
     improved: str,
 ) -> None:
-    """Append suggestion only if LLM produced a non-empty, changed result."""
-    if not improved:
+    """
+    Append suggestion only if LLM produced a non-empty, changed result.
+    `orig_hash` is `_norm_hash(original)`, computed once per original by the caller.
+    """
+    if not improved or not improved.strip():
         return
-    orig_norm = (original or "").strip().lower()
-    imp_norm = improved.strip().lower()
-    if imp_norm and imp_norm != orig_norm:
+    if _norm_hash(improved) != orig_hash:
         out.append(
             ResumeSuggestion(
                 section=section,
@@ -35,78 +258,172 @@ def _combine_entry_text(entry: Any) -> str:
     Turn a single section item (dict / list / str) into a single-line string
     to feed the LLM. Non-destructive (doesn't invent anything).
     """
-    if entry is None:
-        return ""
-
-    # if it's already a simple string
-    if isinstance(entry, str):
-        return entry
-
-    # dict-like entries are common
-    if isinstance(entry, dict):
-        # prefer explicit fields if present
-        for key in ("description", "details", "summary", "line", "text"):
-            val = entry.get(key)
-            if isinstance(val, str) and val.strip():
-                return val.strip()
+    match entry:
+        # if it's already a simple string
+        case str():
+            return entry
+
+        # dict-like entries are common; prefer explicit fields if present
+        case {"description": str(val)} if val.strip():
+            return val.strip()
+        case {"details": str(val)} if val.strip():
+            return val.strip()
+        case {"summary": str(val)} if val.strip():
+            return val.strip()
+        case {"line": str(val)} if val.strip():
+            return val.strip()
+        case {"text": str(val)} if val.strip():
+            return val.strip()
 
         # join bullets if present
-        bullets = entry.get("bullets")
-        if isinstance(bullets, list) and bullets:
+        case {"bullets": list(bullets)} if bullets:
             return " • ".join([b for b in bullets if isinstance(b, str)])
 
-        # as a last resort, join all primitive string-ish values
-        parts: List[str] = []
-        for k, v in entry.items():
-            if isinstance(v, str):
-                parts.append(v)
-            elif isinstance(v, (list, tuple)):
-                parts.extend([x for x in v if isinstance(x, str)])
-        return " • ".join([p for p in parts if p.strip()])
+        case dict():
+            # as a last resort, join all primitive string-ish values
+            parts: List[str] = []
+            for k, v in entry.items():
+                if isinstance(v, str):
+                    parts.append(v)
+                elif isinstance(v, (list, tuple)):
+                    parts.extend([x for x in v if isinstance(x, str)])
+            return " • ".join([p for p in parts if p.strip()])
+
+        # list of strings/bullets
+        case list():
+            return " • ".join([x for x in entry if isinstance(x, str)])
 
-    # list of strings/bullets
-    if isinstance(entry, list):
-        return " • ".join([x for x in entry if isinstance(x, str)])
+        case _:
+            return ""
 
-    return ""
 
+def _is_set(canon: str, rank: int, value: Any) -> bool:
+    return value is not None
 
-def _get_items(resume: Dict[str, Any], keys: List[str]) -> List[Any]:
-    """Return list of items for the first matching key in parsed resume."""
-    for k in keys:
-        items = resume.get(k)
-        if isinstance(items, list):
-            return items
-    return []
+
+def _is_usable_resume_value(canon: str, rank: int, value: Any) -> bool:
+    """
+    Same rules as the old per-section lookups: list sections only take a list, skills any
+    non-None value, and summary text is read from the "summary" key only (its synonyms
+    apply to the analysis side).
+    """
+    if canon == "summary":
+        return rank == 0 and value is not None
+    if canon == "skills":
+        return value is not None
+    return isinstance(value, list)
 
 
-def _get_section_issues(analysis: Dict[str, Any], keys: List[str]) -> Any:
+def _canonicalize(
+    section_map: Dict[str, Any],
+    usable: Callable[[str, int, Any], bool] = _is_set,
+) -> Dict[str, Any]:
     """
-    Return the analysis payload for the first matching key.
-    Can be a list (per-item issues) or a dict (section-level issues).
+    Rewrite top-level keys (case-insensitively) to canonical section names via `_CANON`,
+    so each section is a single lookup. When several synonyms of a section are present,
+    the highest-priority one (see `_SECTION_KEYS`) whose value passes
+    `usable(canon, rank, value)` wins; values that fail it are ignored.
+    Non-string keys and keys that name no section are dropped.
     """
-    for k in keys:
-        if k in analysis:
-            return analysis[k]
-    return None
+    out: Dict[str, Any] = {}
+    ranks: Dict[str, int] = {}
+    for k, v in section_map.items():
+        if not isinstance(k, str):
+            continue
+        canon_rank = _CANON.get(k.lower())
+        if canon_rank is None:
+            continue
+        canon, rank = canon_rank
+        if usable(canon, rank, v) and (canon not in ranks or rank < ranks[canon]):
+            out[canon] = v
+            ranks[canon] = rank
+    return out
 
 
 # -------------------- handlers for different section types --------------------
 
-_EXPERIENCE_KEYS = ["experience", "work_experience", "work", "professional_experience"]
-_INTERNSHIP_KEYS = ["internships", "internship"]
-_EDUCATION_KEYS = ["education", "educations"]
-_AWARDS_KEYS = ["awards_achievements", "awards", "achievements", "honors"]
-_POR_KEYS = ["positions_of_responsibility", "leadership", "por"]
-_CO_CURR_KEYS = ["co_curricular", "co_curricular_activities", "cocurricular"]
-_EXTRA_CURR_KEYS = ["extra_curricular", "extracurricular", "extracurricular_activities"]
-_SKILLS_KEYS = ["skills"]
-_SUMMARY_KEYS = ["summary", "objective", "profile"]
+# canonical section name -> accepted keys, in priority order (canonical name first)
+_SECTION_KEYS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "experience": ("experience", "work_experience", "work", "professional_experience"),
+    "internships": ("internships", "internship"),
+    "education": ("education", "educations"),
+    "awards_achievements": ("awards_achievements", "awards", "achievements", "honors"),
+    "positions_of_responsibility": ("positions_of_responsibility", "leadership", "por"),
+    "co_curricular": ("co_curricular", "co_curricular_activities", "cocurricular"),
+    "extra_curricular": ("extra_curricular", "extracurricular", "extracurricular_activities"),
+    "skills": ("skills",),
+    "summary": ("summary", "objective", "profile"),
+})
+
+# key -> (canonical section name, priority), built once at import
+_CANON: Mapping[str, Tuple[str, int]] = MappingProxyType({
+    key: (canon, rank) for canon, keys in _SECTION_KEYS.items() for rank, key in enumerate(keys)
+})
+
+# LLM instructions, one per flag. Interned so the work queue's (original, instruction)
+# keys hash and compare cheaply.
+_INSTR_NO_METRICS = sys.intern("Add measurable impact and metrics without inventing facts")
+_INSTR_WEAK_ACTION_VERBS = sys.intern("Strengthen action verbs; start with a strong verb")
+_INSTR_RESPONSIBILITY_OVER_ACHIEVEMENT = sys.intern("Rewrite as an achievement with outcome and scale")
+_INSTR_TOO_WORDY = sys.intern("Make this a concise one-line resume bullet")
+_INSTR_MISSING_KEYWORDS = sys.intern("Include job-relevant keywords naturally if present in input")
+
+_INSTR_LIST_TOO_WORDY = sys.intern("Make this concise, single resume bullet")
+_INSTR_AWARDS_GENERIC = sys.intern(
+    "Rewrite as crisp, impact-focused bullets; keep titles and recognition clear")
+_INSTR_POR_GENERIC = sys.intern(
+    "Emphasize leadership, scope, and outcomes; keep bullets concise and achievement-focused")
+_INSTR_CO_CURR_GENERIC = sys.intern(
+    "Refine to concise bullets showing relevance and impact; avoid fluff")
+_INSTR_EXTRA_CURR_GENERIC = sys.intern(
+    "Highlight leadership, scale, achievements; keep it to tight resume bullets")
+
+_INSTR_EDU_TOO_GENERIC = sys.intern(
+    "Rewrite as a clean one-line education entry: "
+    "Degree, Major — Institute, Location — Dates. "
+    "Include GPA/CGPA and honors only if present in input. Do not invent.")
+_INSTR_EDU_MISSING_DATES = sys.intern(
+    "Standardize dates to MMM YYYY or YYYY range if present; keep concise; do not fabricate.")
+_INSTR_EDU_MISSING_GPA = sys.intern(
+    "If GPA/CGPA is present in the input, include it in a standard format; otherwise omit.")
+_INSTR_EDU_TOO_WORDY = sys.intern(
+    "Make this a single concise line focusing on degree, institute, location, dates (and GPA if present).")
+_INSTR_EDU_SECTION = sys.intern(
+    "Polish education entries to one-line standardized format: "
+    "Degree, Major — Institute, Location — Dates — GPA/CGPA (if present). "
+    "Do not invent any data.")
+
+_INSTR_SKILLS_TOO_GENERIC = sys.intern(
+    "Cluster by category (e.g., Languages, Frameworks, Tools) and include proficiency levels "
+    "only if present in input. Keep it concise.")
+
+_INSTR_SUMMARY_TOO_GENERIC = sys.intern("Make summary specific and tailored to the target role")
+_INSTR_SUMMARY_TOO_LONG = sys.intern("Make summary concise (2–3 lines)")
+
+# experience-like flags: (flags that trigger it, issue label, LLM instruction)
+_EXPERIENCE_FLAGS = (
+    (("no_metrics", "missing_metrics"), "No measurable impact", _INSTR_NO_METRICS),
+    (("weak_action_verbs",), "Weak action verbs", _INSTR_WEAK_ACTION_VERBS),
+    (("responsibility_over_achievement",), "Not achievement-oriented", _INSTR_RESPONSIBILITY_OVER_ACHIEVEMENT),
+    (("too_wordy", "too_long"), "Too wordy", _INSTR_TOO_WORDY),
+    (("missing_keywords",), "Missing keywords", _INSTR_MISSING_KEYWORDS),
+)
+
+
+# per-item flags that make the experience-like handler queue a rewrite
+_ACTIONABLE = frozenset(f for flags, _, _ in _EXPERIENCE_FLAGS for f in flags)
+
+# per-item flags the simple-list handler acts on; anything else is ignored
+_KNOWN_LIST_FLAGS = frozenset({"too_generic", "missing_impact", "too_wordy", "too_long"})
+
+
+def _has_actionable_flags(issues: List[Any], actionable: frozenset = _ACTIONABLE) -> bool:
+    """True if any per-item issue dict sets one of the `actionable` flags."""
+    return any(k in actionable and v for d in issues if isinstance(d, dict) for k, v in d.items())
 
 
 def _process_experience_like(
-    suggestions: List[ResumeSuggestion],
-    llm_client,
+    queue: _LLMWorkQueue,
     section_label: str,
     items: List[Any],
     issues: Any,
@@ -115,41 +432,26 @@ def _process_experience_like(
     Handle sections that are lists of role entries: experience / internships.
     `issues` is expected to be a list with same indexing as items, where each entry is a dict of flags.
     """
-    if not isinstance(issues, list):
+    if not isinstance(items, list) or not items or not isinstance(issues, list):
         return
+    if not _has_actionable_flags(issues):
+        return  # clean section: skip the per-item walk
 
-    for idx, issue_dict in enumerate(issues):
+    for item, issue_dict in zip_longest(items, issues, fillvalue=None):
         if not isinstance(issue_dict, dict):
             continue
-        original = _combine_entry_text(items[idx] if idx < len(items) else "")
+        original = queue.entry_text(item or "")
         if not original:
             continue
 
         # map common flags -> concise LLM instructions
-        if issue_dict.get("no_metrics") or issue_dict.get("missing_metrics"):
-            improved = llm_call(llm_client, original, "Add measurable impact and metrics without inventing facts")
-            _append_if_changed(suggestions, section_label, "No measurable impact", original, improved)
-
-        if issue_dict.get("weak_action_verbs"):
-            improved = llm_call(llm_client, original, "Strengthen action verbs; start with a strong verb")
-            _append_if_changed(suggestions, section_label, "Weak action verbs", original, improved)
-
-        if issue_dict.get("responsibility_over_achievement"):
-            improved = llm_call(llm_client, original, "Rewrite as an achievement with outcome and scale")
-            _append_if_changed(suggestions, section_label, "Not achievement-oriented", original, improved)
-
-        if issue_dict.get("too_wordy") or issue_dict.get("too_long"):
-            improved = llm_call(llm_client, original, "Make this a concise one-line resume bullet")
-            _append_if_changed(suggestions, section_label, "Too wordy", original, improved)
-
-        if issue_dict.get("missing_keywords"):
-            improved = llm_call(llm_client, original, "Include job-relevant keywords naturally if present in input")
-            _append_if_changed(suggestions, section_label, "Missing keywords", original, improved)
+        for flags, issue, instr in _EXPERIENCE_FLAGS:
+            if any(issue_dict.get(f) for f in flags):
+                queue.suggest(section_label, issue, original, instr, batch=True)
 
 
 def _process_simple_list_section(
-    suggestions: List[ResumeSuggestion],
-    llm_client,
+    queue: _LLMWorkQueue,
     section_label: str,
     items: List[Any],
     issues: Any,
@@ -159,42 +461,37 @@ def _process_simple_list_section(
     Handle sections that are usually bullet-like lists (awards, POR, co-/extra-curricular).
     Issues can be a list (per-item flags) or a dict (section-level).
     """
+    if not isinstance(items, list) or not items:
+        return
+
     # Per-item issues
     if isinstance(issues, list):
-        for idx, issue_dict in enumerate(issues):
+        if not _has_actionable_flags(issues, _KNOWN_LIST_FLAGS):
+            return  # clean section: skip the per-item walk
+        for item, issue_dict in zip_longest(items, issues, fillvalue=None):
             if not isinstance(issue_dict, dict):
                 continue
-            original = _combine_entry_text(items[idx] if idx < len(items) else "")
+            original = queue.entry_text(item or "")
             if not original:
                 continue
 
             # common flags
-            applied = False
             if issue_dict.get("too_generic") or issue_dict.get("missing_impact"):
-                improved = llm_call(llm_client, original, generic_instruction)
-                _append_if_changed(suggestions, section_label, "Too generic", original, improved)
-                applied = True
+                queue.suggest(section_label, "Too generic", original, generic_instruction, batch=True)
 
             if issue_dict.get("too_wordy") or issue_dict.get("too_long"):
-                improved = llm_call(llm_client, original, "Make this concise, single resume bullet")
-                _append_if_changed(suggestions, section_label, "Too wordy", original, improved)
-                applied = True
-
-            if not applied and issue_dict:  # unknown flags -> generic polish
-                improved = llm_call(llm_client, original, generic_instruction)
-                _append_if_changed(suggestions, section_label, "Improve phrasing", original, improved)
+                queue.suggest(section_label, "Too wordy", original, _INSTR_LIST_TOO_WORDY, batch=True)
 
     # Section-level issues (polish all bullets as one block)
     elif isinstance(issues, dict) and (issues.get("too_generic") or issues.get("too_long") or issues.get("missing_impact")):
-        block = " • ".join([_combine_entry_text(x) for x in items])
+        block = " • ".join([queue.entry_text(x) for x in items])
         if block:
-            improved = llm_call(llm_client, block, generic_instruction)
-            _append_if_changed(suggestions, section_label, "Section too generic", block, improved)
+            queue.suggest(section_label, "Section too generic", block, generic_instruction)
 
 
 def _process_education(
-    suggestions: List[ResumeSuggestion],
-    llm_client,
+    queue: _LLMWorkQueue,
+    section_label: str,
     items: List[Any],
     issues: Any,
 ) -> None:
@@ -202,105 +499,113 @@ def _process_education(
     Education entries are typically list[dict].
     We support common flags; fallback to standardized one-line formatting.
     """
+    if not isinstance(items, list) or not items:
+        return
+
     if isinstance(issues, list):
-        for idx, issue_dict in enumerate(issues):
+        for item, issue_dict in zip_longest(items, issues, fillvalue=None):
             if not isinstance(issue_dict, dict):
                 continue
-            original = _combine_entry_text(items[idx] if idx < len(items) else "")
+            original = queue.entry_text(item or "")
             if not original:
                 continue
 
             # known flags
             if issue_dict.get("too_generic"):
-                instr = ("Rewrite as a clean one-line education entry: "
-                         "Degree, Major — Institute, Location — Dates. "
-                         "Include GPA/CGPA and honors only if present in input. Do not invent.")
-                improved = llm_call(llm_client, original, instr)
-                _append_if_changed(suggestions, "education", "Too generic", original, improved)
+                queue.suggest(section_label, "Too generic", original, _INSTR_EDU_TOO_GENERIC)
 
             if issue_dict.get("missing_dates"):
-                instr = "Standardize dates to MMM YYYY or YYYY range if present; keep concise; do not fabricate."
-                improved = llm_call(llm_client, original, instr)
-                _append_if_changed(suggestions, "education", "Missing dates", original, improved)
+                queue.suggest(section_label, "Missing dates", original, _INSTR_EDU_MISSING_DATES)
 
             if issue_dict.get("missing_gpa"):
-                instr = "If GPA/CGPA is present in the input, include it in a standard format; otherwise omit."
-                improved = llm_call(llm_client, original, instr)
-                _append_if_changed(suggestions, "education", "GPA/CGPA formatting", original, improved)
+                queue.suggest(section_label, "GPA/CGPA formatting", original, _INSTR_EDU_MISSING_GPA)
 
             if issue_dict.get("too_wordy") or issue_dict.get("too_long"):
-                instr = "Make this a single concise line focusing on degree, institute, location, dates (and GPA if present)."
-                improved = llm_call(llm_client, original, instr)
-                _append_if_changed(suggestions, "education", "Too wordy", original, improved)
+                queue.suggest(section_label, "Too wordy", original, _INSTR_EDU_TOO_WORDY)
 
     elif isinstance(issues, dict) and (issues.get("too_generic") or issues.get("too_long")):
         # Section-level cleanup
-        block = " • ".join([_combine_entry_text(x) for x in items])
+        block = " • ".join([queue.entry_text(x) for x in items])
         if block:
-            instr = ("Polish education entries to one-line standardized format: "
-                     "Degree, Major — Institute, Location — Dates — GPA/CGPA (if present). "
-                     "Do not invent any data.")
-            improved = llm_call(llm_client, block, instr)
-            _append_if_changed(suggestions, "education", "Section needs standardization", block, improved)
+            queue.suggest(section_label, "Section needs standardization", block, _INSTR_EDU_SECTION)
+
+_SKILL_CATEGORIES = ("technical", "tools", "languages", "frameworks", "soft")
 
-def _get_skills_text(resume_text: Dict[str, Any]) -> str:
+
+def _get_skills_text(skills: Any) -> str:
     """Flatten skills (list or dict) into a comma-separated string."""
-    skills = resume_text.get("skills")
-    flat: List[str] = []
-    if isinstance(skills, list):
-        flat = [s for s in skills if isinstance(s, str)]
-    elif isinstance(skills, dict):
-        for k in ("technical", "tools", "languages", "frameworks", "soft"):
-            vals = skills.get(k)
-            if isinstance(vals, list):
-                flat.extend([s for s in vals if isinstance(s, str)])
-    return ", ".join(flat)
-
-def _process_skills( 
-    suggestions: List[ResumeSuggestion],
-    llm_client,
-    resume_text: Dict[str, Any],
+    if isinstance(skills, dict):
+        skills = chain.from_iterable(
+            vals for vals in map(skills.get, _SKILL_CATEGORIES) if isinstance(vals, list)
+        )
+    elif not isinstance(skills, list):
+        return ""
+    return ", ".join(s for s in skills if isinstance(s, str))
+
+def _process_skills(
+    queue: _LLMWorkQueue,
+    section_label: str,
+    skills: Any,
     issues: Any,
 ) -> None:
-    original = _get_skills_text(resume_text)
+    original = _get_skills_text(skills)
     if not original:
         return
 
     if isinstance(issues, dict):
-        if issues.get("too_generic") or issues.get("missing_proficiency"):
-            issue_text = "Skills too generic" if issues.get("too_generic") else "Missing proficiency levels"
-            instr = ("Cluster by category (e.g., Languages, Frameworks, Tools) and include proficiency levels "
-                     "only if present in input. Keep it concise.")
-            improved = llm_call(llm_client, original, instr)
-            _append_if_changed(suggestions, "skills", issue_text, original, improved)
+        if (too_generic := issues.get("too_generic")) or issues.get("missing_proficiency"):
+            issue_text = "Skills too generic" if too_generic else "Missing proficiency levels"
+            queue.suggest(section_label, issue_text, original, _INSTR_SKILLS_TOO_GENERIC)
 
 def _process_summary(
-    suggestions: List[ResumeSuggestion],
-    llm_client,
-    resume_text: Dict[str, Any],
+    queue: _LLMWorkQueue,
+    section_label: str,
+    summary: Any,
     issues: Any,
 ) -> None:
-    original = resume_text.get("summary") if isinstance(resume_text.get("summary"), str) else ""
+    original = summary if isinstance(summary, str) else ""
     if not original:
         return
 
     if isinstance(issues, dict):
         if issues.get("too_generic"):
-            improved = llm_call(llm_client, original, "Make summary specific and tailored to the target role")
-            _append_if_changed(suggestions, "summary", "Summary too generic", original, improved)
+            queue.suggest(section_label, "Summary too generic", original, _INSTR_SUMMARY_TOO_GENERIC)
 
         if issues.get("too_long"):
-            improved = llm_call(llm_client, original, "Make summary concise (2–3 lines)")
-            _append_if_changed(suggestions, "summary", "Summary too long", original, improved)
+            queue.suggest(section_label, "Summary too long", original, _INSTR_SUMMARY_TOO_LONG)
 
         if issues.get("missing_keywords"):
-            improved = llm_call(llm_client, original, "Include job-relevant keywords naturally if present in input")
-            _append_if_changed(suggestions, "summary", "Missing keywords", original, improved)
+            queue.suggest(section_label, "Missing keywords", original, _INSTR_MISSING_KEYWORDS)
 
 
 # -------------------- public entrypoint --------------------
 
-def generate_resume_improvements(
+class _SectionSpec(NamedTuple):
+    label: str  # canonical section name, see `_SECTION_KEYS`
+    # called as handler(queue, label, resume value, analysis value, **extra)
+    handler: Callable[..., None]
+    extra: Mapping[str, Any] = MappingProxyType({})
+
+
+_SECTIONS: Tuple[_SectionSpec, ...] = (
+    # Experience-like: work experience, internships
+    _SectionSpec("experience", _process_experience_like),
+    _SectionSpec("internships", _process_experience_like),
+    _SectionSpec("education", _process_education),
+    _SectionSpec("awards_achievements", _process_simple_list_section,
+                 MappingProxyType({"generic_instruction": _INSTR_AWARDS_GENERIC})),
+    _SectionSpec("positions_of_responsibility", _process_simple_list_section,
+                 MappingProxyType({"generic_instruction": _INSTR_POR_GENERIC})),
+    _SectionSpec("co_curricular", _process_simple_list_section,
+                 MappingProxyType({"generic_instruction": _INSTR_CO_CURR_GENERIC})),
+    _SectionSpec("extra_curricular", _process_simple_list_section,
+                 MappingProxyType({"generic_instruction": _INSTR_EXTRA_CURR_GENERIC})),
+    _SectionSpec("skills", _process_skills),
+    _SectionSpec("summary", _process_summary),
+)
+
+
+async def generate_resume_improvements(
     llm_client,
     analysis: Dict[str, Any],
     resume_text: Dict[str, Any],
@@ -315,84 +620,19 @@ def generate_resume_improvements(
     if not analysis or not resume_text:
         return suggestions  # Always return a list
 
-    # Experience-like: work experience
-    exp_items = _get_items(resume_text, _EXPERIENCE_KEYS)
-    exp_issues = _get_section_issues(analysis, _EXPERIENCE_KEYS)
-    if exp_items and exp_issues is not None:
-        _process_experience_like(suggestions, llm_client, "experience", exp_items, exp_issues)
-
-    # Experience-like: internships
-    intern_items = _get_items(resume_text, _INTERNSHIP_KEYS)
-    intern_issues = _get_section_issues(analysis, _INTERNSHIP_KEYS)
-    if intern_items and intern_issues is not None:
-        _process_experience_like(suggestions, llm_client, "internships", intern_items, intern_issues)
-
-    # Education
-    edu_items = _get_items(resume_text, _EDUCATION_KEYS)
-    edu_issues = _get_section_issues(analysis, _EDUCATION_KEYS)
-    if edu_items and edu_issues is not None:
-        _process_education(suggestions, llm_client, edu_items, edu_issues)
-
-    # Awards & Achievements
-    awards_items = _get_items(resume_text, _AWARDS_KEYS)
-    awards_issues = _get_section_issues(analysis, _AWARDS_KEYS)
-    if awards_items and awards_issues is not None:
-        _process_simple_list_section(
-            suggestions,
-            llm_client,
-            "awards_achievements",
-            awards_items,
-            awards_issues,
-            generic_instruction="Rewrite as crisp, impact-focused bullets; keep titles and recognition clear",
-        )
+    # Handlers only queue LLM calls; the unique ones run concurrently below.
+    queue = _LLMWorkQueue(llm_client)
 
-    # Positions of Responsibility
-    por_items = _get_items(resume_text, _POR_KEYS)
-    por_issues = _get_section_issues(analysis, _POR_KEYS)
-    if por_items and por_issues is not None:
-        _process_simple_list_section(
-            suggestions,
-            llm_client,
-            "positions_of_responsibility",
-            por_items,
-            por_issues,
-            generic_instruction="Emphasize leadership, scope, and outcomes; keep bullets concise and achievement-focused",
-        )
-
-    # Co-curricular
-    co_curr_items = _get_items(resume_text, _CO_CURR_KEYS)
-    co_curr_issues = _get_section_issues(analysis, _CO_CURR_KEYS)
-    if co_curr_items and co_curr_issues is not None:
-        _process_simple_list_section(
-            suggestions,
-            llm_client,
-            "co_curricular",
-            co_curr_items,
-            co_curr_issues,
-            generic_instruction="Refine to concise bullets showing relevance and impact; avoid fluff",
-        )
-
-    # Extra-curricular
-    extra_curr_items = _get_items(resume_text, _EXTRA_CURR_KEYS)
-    extra_curr_issues = _get_section_issues(analysis, _EXTRA_CURR_KEYS)
-    if extra_curr_items and extra_curr_issues is not None:
-        _process_simple_list_section(
-            suggestions,
-            llm_client,
-            "extra_curricular",
-            extra_curr_items,
-            extra_curr_issues,
-            generic_instruction="Highlight leadership, scale, achievements; keep it to tight resume bullets",
-        )
+    # map synonym keys to canonical section names once instead of per section
+    resume = _canonicalize(resume_text, _is_usable_resume_value)
+    analysis = _canonicalize(analysis)
 
-    # Skills
-    skills_issues = _get_section_issues(analysis, _SKILLS_KEYS)
-    if skills_issues is not None:
-        _process_skills(suggestions, llm_client, resume_text, skills_issues)
+    for spec in _SECTIONS:
+        if (issues := analysis.get(spec.label)) is not None:
+            spec.handler(queue, spec.label, resume.get(spec.label), issues, **spec.extra)
 
-    # Summary
-    summary_issues = _get_section_issues(analysis, _SUMMARY_KEYS)
-    if summary_issues is not None:
-        _process_summary(suggestions, llm_client, resume_text, summary_issues)
+    await queue.flush()
+    for section, issue, original, orig_hash, future in queue.entries:
+        _append_if_changed(suggestions, section, issue, original, orig_hash, future.result())
 
     return suggestions
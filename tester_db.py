@@ -1,5 +1,6 @@
 # db_tester.py 
 
+import asyncio
 import psycopg2
 import json
 import os
@@ -76,7 +77,7 @@ if __name__ == "__main__":
             print("⚠️ parsed_resume is None. Skipping resume building.")
         else:
             # Generate suggestions (now uses dynamic section keys)
-            suggestions = generate_resume_improvements(llm_client, analysis_result, parsed_resume) # type: ignore
+            suggestions = asyncio.run(generate_resume_improvements(llm_client, analysis_result, parsed_resume)) # type: ignore
 
             # Build improved resume
             new_resume = build_new_resume(parsed_resume, suggestions)
@@ -1,8 +1,13 @@
 # db_tester.py 
 
-import psycopg2
-import json
+import asyncio
+import aiofiles
+import asyncpg
+import orjson
 import os
+import sys
+import uuid
+from typing import List
 from backend.resume_improv_lib.generator import generate_resume_improvements
 from backend.resume_improv_lib.new_resume_generator import build_new_resume
 import google.generativeai as genai
@@ -22,56 +27,106 @@ genai.configure(api_key=os.getenv("GEMINI_API_KEY")) # type: ignore
 llm_client = genai.GenerativeModel(model_name="gemini-2.5-flash") # type: ignore
 
 
-def fetch_resume(row_id: int):
-    conn = psycopg2.connect(
-        host=DB_HOST, dbname=DB_NAME,
-        user=DB_USER, password=DB_PASS, port=DB_PORT
+async def prewarm_llm() -> None:
+    """
+    Open both Gemini gRPC channels (sync one used by llm_call, asyncio one used for batches)
+    before the fan-out, so TLS + HTTP/2 setup happens once. count_tokens is a free call.
+    Must run inside the same event loop as the generator: the asyncio channel is bound to it.
+    Best-effort: a failed ping is reported and the run continues with cold channels.
+    """
+    try:
+        await asyncio.gather(
+            llm_client.count_tokens_async("ping"),
+            asyncio.to_thread(llm_client.count_tokens, "ping"),
+        )
+    except Exception as e:
+        print(f"⚠️ Gemini warm-up failed, continuing without it: {e!r}")
+
+
+_JSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+async def _init_conn(conn: asyncpg.Connection) -> None:
+    # decode jsonb columns (parsed_resume / analysis_result) with orjson
+    await conn.set_type_codec(
+        "jsonb", schema="pg_catalog",
+        encoder=lambda v: orjson.dumps(v).decode(), decoder=orjson.loads,
     )
-    cur = conn.cursor()
 
-    cur.execute("""
+
+async def fetch_resume(pool: asyncpg.Pool, row_id: str):
+    # pass a real UUID so the server uses the id index directly
+    return await pool.fetchrow("""
         SELECT id, resume_text, parsed_resume, analysis_result
         FROM resume_analyses
-        WHERE id = %s
-    """, (str(row_id),))   # cast to str for safety
+        WHERE id = $1
+    """, uuid.UUID(row_id))
 
-    row = cur.fetchone()
-    cur.close()
-    conn.close()
-    return row
 
-
-if __name__ == "__main__":
-    # pick a test resume by ID
-    row_id = "77ddeb6b-fbbb-48ad-9394-7dc6794001e4"  
-
-    data = fetch_resume(row_id) # type: ignore
+async def process_one(pool: asyncpg.Pool, row_id: str) -> None:
+    """Fetch one resume, generate suggestions, build the new resume and save it as JSON."""
+    data = await fetch_resume(pool, row_id)
     if not data:
         print(f"No row found for id={row_id}")
-    else:
-        resume_id, resume_text, parsed_resume, analysis_result = data
-
-        print("\n===== Fetched Resume From DB =====")
-        print("resume_text:", (resume_text[:200] + "...") if resume_text else "None")
-        print("parsed_resume:", parsed_resume)
-        print("analysis_result:", analysis_result)
-        
+        return
+
+    resume_id, resume_text, parsed_resume, analysis_result = data
+
+    print("\n===== Fetched Resume From DB =====")
+    print("resume_text:", (resume_text[:200] + "...") if resume_text else "None")
+    print("parsed_resume:", parsed_resume)
+    print("analysis_result:", analysis_result)
+
     if parsed_resume is None:
         print("⚠️ parsed_resume is None for this row. Skipping resume building.")
-    else:
-        # Generate suggestions
-        suggestions = generate_resume_improvements(llm_client, analysis_result, parsed_resume)
+        return
+
+    # Generate suggestions
+    suggestions = await generate_resume_improvements(llm_client, analysis_result, parsed_resume)
+
+    # Build improved resume
+    new_resume = build_new_resume(parsed_resume, suggestions)
+
+    # serialize once; the same bytes go to the console and the file
+    blob = orjson.dumps(new_resume, option=_JSON_OPTS)
+
+    # --- Print to console (pretty JSON) ---
+    print(f"\n===== New Resume JSON ({resume_id}) =====", flush=True)
+    sys.stdout.buffer.write(blob + b"\n")
+    sys.stdout.buffer.flush()
 
-        # Build improved resume
-        new_resume = build_new_resume(parsed_resume, suggestions)
+    # --- Save to a .json file ---
+    output_path = f"new_resume_{resume_id}.json"
+    async with aiofiles.open(output_path, "wb") as f:
+        await f.write(blob)
 
-        # --- Print to console (pretty JSON) ---
-        print("\n===== New Resume JSON =====")
-        print(json.dumps(new_resume, indent=2))
+    print(f"\n✅ New resume JSON saved to {output_path}")
 
-        # --- Save to a .json file ---
-        output_path = f"new_resume_{resume_id}.json"
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(new_resume, f, indent=2, ensure_ascii=False)
 
-        print(f"\n✅ New resume JSON saved to {output_path}")
+async def main(ids: List[str]) -> None:
+    """Process all resumes concurrently; DB fetches, LLM calls and file writes of different ids overlap."""
+    # the Supabase pooler (6543) runs in transaction mode, which doesn't support
+    # asyncpg's named prepared-statement cache
+    async with asyncpg.create_pool(
+        host=DB_HOST, database=DB_NAME,
+        user=DB_USER, password=DB_PASS, port=DB_PORT,
+        init=_init_conn,
+        statement_cache_size=0,
+        min_size=1, max_size=min(len(ids), 10),
+    ) as pool:
+        await prewarm_llm()
+        results = await asyncio.gather(
+            *(process_one(pool, row_id) for row_id in ids),
+            return_exceptions=True,
+        )
+
+    # one bad id (malformed uuid, DB or LLM error) shouldn't abort the rest of the batch
+    for row_id, result in zip(ids, results):
+        if isinstance(result, BaseException):
+            print(f"❌ Failed to process id={row_id}: {result!r}")
+
+
+if __name__ == "__main__":
+    # pick test resumes by ID (pass ids as arguments; defaults to the usual sample)
+    ids = sys.argv[1:] or ["77ddeb6b-fbbb-48ad-9394-7dc6794001e4"]
+    asyncio.run(main(ids))